@@ -1,49 +1,410 @@
 import os
 import time
-import json
-import requests
+import orjson
+import random
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
 import smtplib
+import queue
+import atexit
 import logging
+import logging.handlers
+import shutil
 import platform
 import subprocess
 import signal
+import contextlib
+from array import array
+from bisect import bisect_left, bisect_right
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from email.mime.text import MIMEText
-from typing import Optional, Dict, Union, List
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+from email.message import EmailMessage
+from typing import Optional, Dict, Union, List, Set, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional; the in-process cache is used instead
+    aioredis = None
+
+# Configure logging. Records are put on a queue and written to the console and
+# log file by a listener thread, so the monitoring loop never blocks on log I/O.
+_log_formatter = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("crypto_alert.log")  # Also log to file
-    ]
 )
-
-class PriceCondition:
-    def __init__(self, target_price: float, condition_type: str = "above"):
-        """
-        Initialize a price condition
-        :param target_price: The target price to compare against
-        :param condition_type: "above" or "below"
-        """
-        self.target_price = float(target_price)
-        if condition_type not in ["above", "below"]:
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler("crypto_alert.log")  # Also log to file
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *_log_handlers)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on shutdown
+
+# Seconds an idle SMTP connection may sit before the email sender sends a NOOP
+SMTP_NOOP_INTERVAL = 120
+
+@dataclass(slots=True, frozen=True)
+class PriceCondition(ABC):
+    """
+    A price condition
+    :param target_price: The target price to compare against
+    :param condition_type: "above" or "below"
+
+    Calling PriceCondition(target, "above"/"below") returns the matching
+    specialised subclass, so is_met never branches on the type.
+    """
+
+    target_price: float
+    condition_type: str = "above"
+
+    # Arguments default so copy and pickle can call cls.__new__(cls) on a subclass
+    def __new__(cls, target_price: float = 0.0, condition_type: str = "above"):
+        if cls is PriceCondition:
+            if condition_type not in CONDITION_CLASSES:
+                raise ValueError("condition_type must be either 'above' or 'below'")
+            cls = CONDITION_CLASSES[condition_type]
+        # Zero-argument super() is unusable here: slots=True rebuilds the class
+        return object.__new__(cls)
+
+    def __post_init__(self):
+        if self.condition_type not in CONDITION_CLASSES:
             raise ValueError("condition_type must be either 'above' or 'below'")
-        self.condition_type = condition_type
+        if CONDITION_CLASSES[self.condition_type] is not type(self):
+            raise ValueError(f"{type(self).__name__} cannot have condition_type '{self.condition_type}'")
+        object.__setattr__(self, "target_price", float(self.target_price))
 
+    @abstractmethod
     def is_met(self, current_price: float) -> bool:
         """Check if the price condition is met."""
-        if self.condition_type == "above":
-            return current_price >= self.target_price
-        else:  # condition_type == "below"
-            return current_price <= self.target_price
 
     def __str__(self) -> str:
         return f"Price {self.condition_type} ${self.target_price}"
 
+@dataclass(slots=True, frozen=True)
+class AbovePriceCondition(PriceCondition):
+    condition_type: str = "above"
+
+    def is_met(self, current_price: float) -> bool:
+        return current_price >= self.target_price
+
+@dataclass(slots=True, frozen=True)
+class BelowPriceCondition(PriceCondition):
+    condition_type: str = "below"
+
+    def is_met(self, current_price: float) -> bool:
+        return current_price <= self.target_price
+
+CONDITION_CLASSES = {"above": AbovePriceCondition, "below": BelowPriceCondition}
+
+class PriceFetcher:
+    """
+    Shared CoinGecko client. Every bot in the process subscribes here so that
+    one /simple/price request fetches prices for all monitored coins at once.
+    """
+
+    _instance: Optional["PriceFetcher"] = None
+    # coin_id -> (monotonic fetch time, market data); used when Redis is not configured
+    _price_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+    def __init__(self):
+        self.subscribers: Set["CryptoAlertBot"] = set()
+        self.prices: Dict[str, Dict[str, float]] = {}
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._url: Optional[str] = None
+
+        # Seconds a fetched price is served from cache before CoinGecko is asked again
+        self.cache_ttl = int(os.getenv("PRICE_CACHE_TTL", "30"))
+        self.redis_url = os.getenv("REDIS_URL")
+        self.redis = None
+
+        # Rate-limit handling: minimum gap between requests and back-off after 429/5xx
+        self.min_request_interval = float(os.getenv("MIN_REQUEST_INTERVAL", "2"))
+        self._next_allowed_request_ts = 0.0
+        self._failed_attempts = 0
+        # Token bucket capping requests per minute to stay inside CoinGecko's free-tier quota
+        self._rate_limit = AsyncLimiter(max_rate=int(os.getenv("COINGECKO_RATE_LIMIT", "25")), time_period=60)
+
+        if self.redis_url and aioredis is None:
+            logging.warning("REDIS_URL is set but the redis package is not installed; using in-memory cache.")
+
+    @classmethod
+    def instance(cls) -> "PriceFetcher":
+        """Return the process-wide fetcher, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _update_url(self):
+        """Rebuild the batch request URL; only needed when the set of coins changes."""
+        coin_ids = sorted({bot.coin_id for bot in self.subscribers})
+        self._url = (
+            "https://api.coingecko.com/api/v3/simple/price"
+            f"?ids={','.join(coin_ids)}"
+            "&vs_currencies=usd"
+            "&include_24hr_vol=true"
+            "&include_24hr_change=true"
+        )
+
+    def subscribe(self, bot: "CryptoAlertBot"):
+        """Register a bot; must be called from within the running event loop."""
+        if self.session is None or self.session.closed:
+            # One pooled session for the whole process. The keep-alive window outlasts
+            # a typical check interval so each tick reuses the open TLS connection.
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={
+                    "Accept": "application/json",
+                    "User-Agent": "CryptoAlertBot/1.0",
+                },
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=120),
+            )
+        if self.redis is None and self.redis_url and aioredis is not None:
+            self.redis = aioredis.from_url(self.redis_url)
+        self.subscribers.add(bot)
+        self._update_url()
+
+    async def unsubscribe(self, bot: "CryptoAlertBot"):
+        """Remove a bot and close the HTTP session once nobody is left."""
+        self.subscribers.discard(bot)
+        self._update_url()
+        if not self.subscribers and self.session is not None:
+            await self.session.close()
+            self.session = None
+        if not self.subscribers and self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def _cache_get(self, coin_id: str) -> Optional[Dict[str, float]]:
+        """Return cached market data for a coin if it is younger than the TTL."""
+        if self.redis is not None:
+            try:
+                cached = await self.redis.get(f"coin:{coin_id}")
+                return orjson.loads(cached) if cached is not None else None
+            except aioredis.RedisError as e:
+                logging.warning("Redis cache read failed, falling back to API: %s", e)
+                return None
+
+        fetched_at, data = self._price_cache.get(coin_id, (0.0, None))
+        if data is not None and time.monotonic() - fetched_at < self.cache_ttl:
+            return data
+        return None
+
+    async def _cache_set(self, prices: Dict[str, Dict[str, float]]):
+        """Store freshly fetched market data for every coin in the batch."""
+        if self.redis is not None:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for coin_id, data in prices.items():
+                        pipe.setex(f"coin:{coin_id}", self.cache_ttl, orjson.dumps(data))
+                    await pipe.execute()
+            except aioredis.RedisError as e:
+                logging.warning("Redis cache write failed: %s", e)
+            return
+
+        now = time.monotonic()
+        for coin_id, data in prices.items():
+            self._price_cache[coin_id] = (now, data)
+
+    async def fetch(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Fetch prices for all subscribed coins in a single request.
+        Concurrent callers share the request already in flight.
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch_batch())
+            self._inflight.add_done_callback(self._clear_inflight)
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, task: asyncio.Task):
+        if self._inflight is task:
+            self._inflight = None
+
+    def _back_off(self, delay: float):
+        """Push back the next allowed request by `delay` seconds plus jitter."""
+        self._next_allowed_request_ts = time.monotonic() + delay + random.uniform(0, 1)
+
+    async def _fetch_batch(self) -> Optional[Dict[str, Dict[str, float]]]:
+        # Honor any pending back-off or minimum gap before touching the API
+        await asyncio.sleep(max(0, self._next_allowed_request_ts - time.monotonic()))
+        await self._rate_limit.acquire()
+        try:
+            async with self.session.get(self._url) as response:
+                if response.status == 429 or response.status >= 500:
+                    self._failed_attempts += 1
+                    delay = min(60, 2 ** self._failed_attempts)
+                    retry_after = response.headers.get("Retry-After")
+                    if response.status == 429 and retry_after and retry_after.isdigit():
+                        delay = int(retry_after)
+                    self._back_off(delay)
+                    logging.warning(
+                        "CoinGecko returned HTTP %s; backing off for ~%ss", response.status, delay
+                    )
+                    return None
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+
+            self._failed_attempts = 0
+            self._next_allowed_request_ts = time.monotonic() + self.min_request_interval
+
+            # Split the batch response into one slice per coin
+            self.prices = {
+                coin_id: {
+                    "price": coin_data["usd"],
+                    "volume": coin_data.get("usd_24h_vol"),
+                    "change": coin_data.get("usd_24h_change")
+                }
+                for coin_id, coin_data in data.items()
+            }
+            await self._cache_set(self.prices)
+            return self.prices
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error("Network/HTTP error while fetching price: %s", e)
+        except Exception as e:
+            logging.error("Unexpected error: %s", e)
+        return None
+
+    async def get(self, coin_id: str) -> Optional[Dict[str, float]]:
+        """Return the market data slice for one coin, from cache or a fresh batch call."""
+        cached = await self._cache_get(coin_id)
+        if cached is not None:
+            return cached
+
+        prices = await self.fetch()
+        if prices is None:
+            return None
+        if coin_id not in prices:
+            logging.error("Coin ID '%s' not found in API response.", coin_id)
+            return None
+        return prices[coin_id]
+
+class EmailSender:
+    """
+    Shared SMTP sender. Every bot with email alerts subscribes here; one worker
+    task drains a single queue over one long-lived Gmail connection.
+    """
+
+    _instance: Optional["EmailSender"] = None
+
+    def __init__(self):
+        self.subscribers: Set["CryptoAlertBot"] = set()
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._smtp: Optional[smtplib.SMTP_SSL] = None
+        self._credentials: Optional[Tuple[str, str]] = None
+
+    @classmethod
+    def instance(cls) -> "EmailSender":
+        """Return the process-wide sender, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def subscribe(self, bot: "CryptoAlertBot"):
+        """Register a bot; must be called from within the running event loop."""
+        if self._task is None:
+            self.queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._worker())
+        self.subscribers.add(bot)
+
+    async def unsubscribe(self, bot: "CryptoAlertBot"):
+        """Remove a bot; once nobody is left, flush the queue and stop the worker."""
+        self.subscribers.discard(bot)
+        if self.subscribers or self._task is None:
+            return
+        await self.queue.join()
+        self._task.cancel()
+        # Wait for the worker's cleanup (SMTP QUIT) to finish
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.queue = None
+
+    def enqueue(self, msg: EmailMessage, sender_email: str, sender_password: str):
+        """Queue a message to be sent with the given Gmail credentials."""
+        self.queue.put_nowait((msg, (sender_email, sender_password)))
+
+    def _get_smtp(self, credentials: Tuple[str, str]) -> smtplib.SMTP_SSL:
+        """Return the cached SMTP connection for these credentials, logging in if needed."""
+        if self._smtp is not None and self._credentials != credentials:
+            self._close_smtp()
+        if self._smtp is None:
+            server = smtplib.SMTP_SSL("smtp.gmail.com", 465, timeout=30)
+            try:
+                server.login(*credentials)
+            except (smtplib.SMTPException, OSError):
+                server.close()
+                raise
+            self._smtp = server
+            self._credentials = credentials
+        return self._smtp
+
+    def _drop_smtp(self):
+        """Close the socket of a broken connection without attempting QUIT."""
+        if self._smtp is not None:
+            self._smtp.close()
+        self._smtp = None
+
+    def _close_smtp(self):
+        """Close the SMTP connection with QUIT, ignoring errors from a dead link."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _send(self, msg: EmailMessage, credentials: Tuple[str, str]):
+        """
+        Send one message, reconnecting once if the server had dropped the
+        connection. Other SMTP errors (refused recipients, DATA failures) are
+        not retried, so a message that may have been accepted is never resent.
+        """
+        try:
+            self._get_smtp(credentials).send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            self._drop_smtp()
+            self._get_smtp(credentials).send_message(msg)
+
+    def _keepalive(self):
+        """Send NOOP on an idle connection so Gmail doesn't drop it; close it if it's gone."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.noop()
+        except (smtplib.SMTPException, OSError):
+            self._drop_smtp()
+
+    async def _worker(self):
+        """Drain queued alert emails over the shared SMTP connection."""
+        try:
+            while True:
+                try:
+                    msg, credentials = await asyncio.wait_for(self.queue.get(), timeout=SMTP_NOOP_INTERVAL)
+                except asyncio.TimeoutError:
+                    await asyncio.to_thread(self._keepalive)
+                    continue
+
+                try:
+                    await asyncio.to_thread(self._send, msg, credentials)
+                    logging.info("Email alert sent successfully!")
+                except Exception as e:
+                    logging.error("Error sending email: %s", e)
+                    self._drop_smtp()
+                finally:
+                    self.queue.task_done()
+        finally:
+            await asyncio.to_thread(self._close_smtp)
+
 class CryptoAlertBot:
     def __init__(
         self, 
@@ -67,35 +428,82 @@ class CryptoAlertBot:
         :param config_file:       JSON config file for email credentials & preferences
         """
         self.coin_id = coin_id.lower()
+        self._coin_upper = self.coin_id.upper()
         # Ensure we have a list of conditions
         self.conditions = conditions if isinstance(conditions, list) else [conditions]
+        # Conditions sorted by target so the met ones form a contiguous run found by bisect:
+        # "above" conditions are met for every target <= price, "below" for every target >= price
+        self._above = sorted(
+            (c for c in self.conditions if c.condition_type == "above"), key=lambda c: c.target_price
+        )
+        self._below = sorted(
+            (c for c in self.conditions if c.condition_type == "below"), key=lambda c: c.target_price
+        )
+        self._above_targets = array("d", (c.target_price for c in self._above))
+        self._below_targets = array("d", (c.target_price for c in self._below))
         # Ensure we have a list of alert types
         self.alert_types = alert_types if isinstance(alert_types, list) else [alert_types]
 
         self.last_alert_time = None
         self.cooldown_period = cooldown_period
         self.check_interval = check_interval
-        self.sound_file = sound_file
+        self.sound_file = os.fspath(sound_file)
         self.config_file = config_file
         self.running = True
+        self._fetcher = PriceFetcher.instance()
+        self._email_sender = EmailSender.instance()
+        # Email body with the coin filled in once; the rest is filled per alert via format_map
+        self._body_tmpl = (
+            f"Price Alert for {self._coin_upper}!\n\n"
+            "Current Price: ${price:.8f}\n"
+            "Conditions Met:\n{conditions}"
+            "24h Change: {change}%\n"
+            "24h Volume: {volume}\n"
+            "Time: {time}\n"
+        )
+
+        # Validate sound playback up front so a bad path fails at startup, not at the first alert
+        self._afplay: Optional[str] = None
+        self._sound_proc: Optional[subprocess.Popen] = None
+        if "sound" in self.alert_types and platform.system() == "Darwin":
+            if not os.path.isfile(self.sound_file):
+                raise FileNotFoundError(f"Sound file not found: {self.sound_file}")
+            self._afplay = shutil.which("afplay")
+            if self._afplay is None:
+                raise FileNotFoundError("afplay executable not found on PATH")
 
         # Load or create configuration file
+        self._config_hash: Optional[int] = None
         self.config = self.load_config()
 
+    async def setup(self):
+        """Subscribe to the shared price fetcher and install shutdown signal handlers."""
+        self._fetcher.subscribe(self)
+
+        # Emails are sent by the shared background sender so SMTP never stalls price checks
+        if "email" in self.alert_types:
+            self._email_sender.subscribe(self)
+
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self.handle_shutdown)
-        signal.signal(signal.SIGTERM, self.handle_shutdown)
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self.handle_shutdown)
+        loop.add_signal_handler(signal.SIGTERM, self.handle_shutdown)
 
-    def handle_shutdown(self, signum, frame):
-        """Handle graceful shutdown on SIGINT or SIGTERM."""
+    def handle_shutdown(self):
+        """Handle graceful shutdown on SIGINT or SIGTERM for every bot sharing the fetcher."""
         logging.info("Shutting down gracefully...")
-        self.running = False
+        for bot in self._fetcher.subscribers:
+            bot.running = False
 
     def load_config(self) -> Dict:
         """Load configuration from file or create a default config."""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+            # Hash the form save_config writes so an unchanged config is never rewritten,
+            # whatever formatting the file on disk happens to have
+            self._config_hash = hash(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            return config
         except FileNotFoundError:
             # Create a default config if none found
             config = {
@@ -113,11 +521,16 @@ class CryptoAlertBot:
             return config
 
     def save_config(self, config: Dict):
-        """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=4)
+        """Save configuration to file, skipping the write if nothing changed."""
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        config_hash = hash(data)
+        if config_hash == self._config_hash:
+            return
+        with open(self.config_file, 'wb') as f:
+            f.write(data)
+        self._config_hash = config_hash
 
-    def get_current_price(self) -> Optional[Dict[str, float]]:
+    async def get_current_price(self) -> Optional[Dict[str, float]]:
         """
         Enhanced price fetch with additional market data.
         Returns a dictionary with at least:
@@ -125,84 +538,61 @@ class CryptoAlertBot:
           - "volume": float (24h volume)
           - "change": float (% change in last 24h)
         """
-        try:
-            url = (
-                "https://api.coingecko.com/api/v3/simple/price"
-                f"?ids={self.coin_id}"
-                "&vs_currencies=usd"
-                "&include_24hr_vol=true"
-                "&include_24hr_change=true"
-            )
-            headers = {
-                "Accept": "application/json",
-                "User-Agent": "CryptoAlertBot/1.0",
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if self.coin_id not in data:
-                logging.error(f"Coin ID '{self.coin_id}' not found in API response.")
-                return None
-            
-            return {
-                "price": data[self.coin_id]["usd"],
-                "volume": data[self.coin_id].get("usd_24h_vol"),
-                "change": data[self.coin_id].get("usd_24h_change")
-            }
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Network/HTTP error while fetching price: {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-        return None
+        return await self._fetcher.get(self.coin_id)
 
-    def send_email_alert(self, market_data: Dict[str, float], triggered_condition: PriceCondition):
-        """Send an email alert (if credentials exist) with additional market data."""
+    def _enqueue_email_alert(self, market_data: Dict[str, float], triggered: List[PriceCondition]):
+        """
+        Build one email alert (if credentials exist) summarising every condition
+        met in this check, and queue it for the email worker.
+        """
         if not all(self.config["email"].values()):
             logging.error("Email credentials are not properly configured in the JSON config.")
             return
 
-        subject = f"🚨 Price Alert: {self.coin_id.upper()} {triggered_condition}"
-        body = (
-            f"Price Alert for {self.coin_id.upper()}!\n\n"
-            f"Current Price: ${market_data['price']:.8f}\n"
-            f"Condition Met: {triggered_condition}\n"
-            f"24h Change: {market_data.get('change', 'N/A')}%\n"
-            f"24h Volume: ${market_data.get('volume', 'N/A'):,.2f}\n"
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        )
-
-        sender_email = self.config["email"]["sender_email"]
-        sender_password = self.config["email"]["sender_password"]
-        receiver_email = self.config["email"]["receiver_email"]
+        if len(triggered) == 1:
+            subject = f"🚨 Price Alert: {self._coin_upper} {triggered[0]}"
+        else:
+            subject = f"🚨 {len(triggered)} alerts for {self._coin_upper}"
 
         try:
-            msg = MIMEText(body)
+            volume = market_data.get("volume")
+            body = self._body_tmpl.format_map({
+                "price": market_data["price"],
+                "conditions": "".join(f"- {condition}\n" for condition in triggered),
+                "change": market_data.get("change", "N/A"),
+                "volume": f"${volume:,.2f}" if volume is not None else "N/A",
+                "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            })
+
+            msg = EmailMessage()
             msg["Subject"] = subject
-            msg["From"] = sender_email
-            msg["To"] = receiver_email
-
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-                server.login(sender_email, sender_password)
-                server.send_message(msg)
-
-            logging.info("Email alert sent successfully!")
+            msg["From"] = self.config["email"]["sender_email"]
+            msg["To"] = self.config["email"]["receiver_email"]
+            msg.set_content(body)
+            self._email_sender.enqueue(
+                msg, self.config["email"]["sender_email"], self.config["email"]["sender_password"]
+            )
         except Exception as e:
-            logging.error(f"Error sending email: {e}")
+            logging.error("Error building email: %s", e)
 
     def play_sound_alert(self):
-        """Play system sound alert on macOS."""
+        """Start the system sound alert on macOS without waiting for playback to finish."""
         if platform.system() != "Darwin":
             logging.warning("Sound alert is only configured for macOS in this script.")
             return
+        if self._sound_proc is not None and self._sound_proc.poll() is None:
+            logging.info("Previous sound alert still playing, skipping.")
+            return
         try:
-            if not os.path.exists(self.sound_file):
-                logging.error(f"Sound file not found: {self.sound_file}")
-                return
-            subprocess.run(["afplay", self.sound_file], check=True)
-            logging.info("Sound alert played successfully!")
-        except subprocess.SubprocessError as e:
-            logging.error(f"Error playing sound: {e}")
+            self._sound_proc = subprocess.Popen(
+                [self._afplay, self.sound_file],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            logging.info("Sound alert started successfully!")
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.error("Error playing sound: %s", e)
 
     def should_send_alert(self) -> bool:
         """Check if we're past the cooldown period before sending another alert."""
@@ -210,41 +600,84 @@ class CryptoAlertBot:
             return True
         return (time.time() - self.last_alert_time) >= self.cooldown_period
 
-    def start_monitoring(self):
+    def _triggered_conditions(self, price: float) -> List[PriceCondition]:
+        """Return every condition met at `price` using binary search over the sorted targets."""
+        above_count = bisect_right(self._above_targets, price)
+        below_start = bisect_left(self._below_targets, price)
+        if above_count == 0 and below_start == len(self._below):
+            # Calm market: price sits between the lowest "above" and highest "below" target
+            return []
+        return self._above[:above_count] + self._below[below_start:]
+
+    async def _check_coin(self):
+        """Fetch the latest price once and fire alerts for any met conditions."""
+        market_data = await self.get_current_price()
+        if market_data is None:
+            return
+
+        price = market_data["price"]
+        logging.info(
+            "Current %s price: $%.8f | 24h Change: %s%%",
+            self._coin_upper, price, market_data.get("change", "N/A")
+        )
+
+        # Nothing can fire during the cooldown, so skip evaluating conditions entirely
+        if not self.should_send_alert():
+            return
+
+        # Collect every condition met this tick (below 64, above 80, above 100, etc.)
+        # so they go out as a single aggregated alert
+        triggered = self._triggered_conditions(price)
+        if triggered:
+            for condition in triggered:
+                logging.info("Alert condition met: %s", condition)
+
+            # Trigger each alert type (emails are queued, afplay is not waited on)
+            for alert_type in self.alert_types:
+                if alert_type == "email":
+                    self._enqueue_email_alert(market_data, triggered)
+                elif alert_type == "sound":
+                    self.play_sound_alert()
+
+            self.last_alert_time = time.time()
+
+    async def start_monitoring(self):
         """Main loop to monitor the coin price at intervals."""
-        logging.info(f"Starting price monitoring for {self.coin_id.upper()}...")
-        logging.info(f"Alert types enabled: {', '.join(self.alert_types)}")
+        await self.setup()
+        logging.info("Starting price monitoring for %s...", self._coin_upper)
+        logging.info("Alert types enabled: %s", ", ".join(self.alert_types))
         for condition in self.conditions:
-            logging.info(f"Monitoring condition: {condition}")
-
-        while self.running:
-            market_data = self.get_current_price()
-
-            if market_data is not None:
-                price = market_data["price"]
-                logging.info(
-                    f"Current {self.coin_id.upper()} price: ${price:.8f} "
-                    f"| 24h Change: {market_data.get('change', 'N/A')}%"
-                )
-
-                # Check each condition (below 64, above 80, above 100, etc.)
-                for condition in self.conditions:
-                    if condition.is_met(price) and self.should_send_alert():
-                        logging.info(f"Alert condition met: {condition}")
-                        
-                        # Trigger each alert type
-                        for alert_type in self.alert_types:
-                            if alert_type == "email":
-                                self.send_email_alert(market_data, condition)
-                            elif alert_type == "sound":
-                                self.play_sound_alert()
-
-                        self.last_alert_time = time.time()
-            
-            time.sleep(self.check_interval)
+            logging.info("Monitoring condition: %s", condition)
+
+        try:
+            # Schedule checks against fixed deadlines so API latency doesn't make the cadence drift
+            next_tick = time.monotonic()
+            while self.running:
+                await self._check_coin()
+
+                next_tick += self.check_interval
+                delay = next_tick - time.monotonic()
+                if delay < 0:
+                    logging.debug("Price check overran its interval by %.2fs", -delay)
+                    # Resync rather than firing a burst of catch-up checks
+                    next_tick = time.monotonic()
+                await asyncio.sleep(max(0, delay))
+        finally:
+            await self._fetcher.unsubscribe(self)
+            if "email" in self.alert_types:
+                await self._email_sender.unsubscribe(self)
 
         logging.info("Monitoring stopped.")
 
+async def monitor_bots(*bots: CryptoAlertBot):
+    """
+    Run several bots concurrently on one event loop. If any bot fails, the
+    others are cancelled and shut down cleanly before the error propagates.
+    """
+    async with asyncio.TaskGroup() as tg:
+        for bot in bots:
+            tg.create_task(bot.start_monitoring())
+
 # ----------------------------
 # Example usage
 # ----------------------------
@@ -271,7 +704,7 @@ if __name__ == "__main__":
         check_interval=60        # Check the price every 60 seconds
     )
 
-    bot.start_monitoring()
+    asyncio.run(bot.start_monitoring())
 
 '''
 export SENDER_EMAIL="memebotandres@gmail.com"
@@ -287,6 +720,7 @@ a. Basic Example
 
 If you want to set a single price condition, use the following code:
 
+import asyncio
 from crypto_alert_bot import CryptoAlertBot, PriceCondition
 
 bot = CryptoAlertBot(
@@ -294,12 +728,13 @@ bot = CryptoAlertBot(
     conditions=PriceCondition(0.000001, "above"),  # Alert when price goes above 0.000001
     alert_types="sound"  # Alert type: "sound", "email", or both
 )
-bot.start_monitoring()
+asyncio.run(bot.start_monitoring())
 
 b. Advanced Example with Multiple Conditions
 
 For more advanced setups, you can monitor multiple price conditions and use both sound and email alerts:
 
+import asyncio
 from crypto_alert_bot import CryptoAlertBot, PriceCondition
 
 conditions = [
@@ -314,7 +749,7 @@ bot = CryptoAlertBot(
     cooldown_period=300,  # Minimum time between alerts (in seconds)
     check_interval=60  # Check the price every 60 seconds
 )
-bot.start_monitoring()
+asyncio.run(bot.start_monitoring())
 
 Save this in a .py file (e.g., run_bot.py) and run it:
 